@@ -168,7 +168,7 @@ class InspireHEPClient:
         data: dict[str, Any] = response.json()
 
         if use_cache and method == "GET":
-            self._cache.set(cache_key, data)
+            await self._cache.aset(cache_key, data)
 
         return data
 
@@ -224,7 +224,7 @@ class InspireHEPClient:
             )
 
         text = response.text
-        self._cache.set(cache_key, text)
+        await self._cache.aset(cache_key, text)
         return text
 
     # ------------------------------------------------------------------
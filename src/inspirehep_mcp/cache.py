@@ -1,14 +1,94 @@
-"""In-memory TTL cache with LRU eviction and optional SQLite persistence."""
+"""In-memory TTL cache with LRU eviction and optional SQLite persistence.
 
+The persistent backend is a :class:`TieredCache`: a small in-memory LRU
+in front of :class:`SQLiteCache`, so hot keys never touch the database.
+"""
+
+import asyncio
 import json
 import logging
 import sqlite3
+import threading
 import time
 from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from typing import Any
 
+from .utils import json_dumpb, json_dumps, json_loads
+
 logger = logging.getLogger(__name__)
 
+# SQLite >= 3.45 can keep values as JSONB (a pre-parsed binary encoding)
+# instead of JSON text; older builds fall back to plain TEXT.
+_HAS_JSONB = sqlite3.sqlite_version_info >= (3, 45, 0)
+
+if _HAS_JSONB:
+    _VALUE_TYPE = "BLOB"
+    _INSERT_SQL = "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, jsonb(?), ?)"
+    _SELECT_SQL = "SELECT json(value), ts FROM cache WHERE key = ?"
+    # jsonb() must be handed JSON text: a blob argument is first probed
+    # as binary JSONB, which short payloads could be mistaken for
+    _encode_value: Callable[[Any], str | bytes] = json_dumps
+else:
+    _VALUE_TYPE = "TEXT"
+    _INSERT_SQL = "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)"
+    _SELECT_SQL = "SELECT value, ts FROM cache WHERE key = ?"
+    # Bind the encoder's UTF-8 bytes as-is rather than holding a decoded
+    # str copy of every (possibly large) record alongside them
+    _encode_value = json_dumpb
+
+# Recorded in the database's ``user_version``: a file written with one value
+# encoding is unreadable with the other, and the same file may be opened by
+# Pythons linked against different SQLite builds
+_STORAGE_FORMAT = 2 if _HAS_JSONB else 1
+
+_DELETE_SQL = "DELETE FROM cache WHERE key = ?"
+_COUNT_SQL = "SELECT COUNT(*) FROM cache"
+# Selecting rowids lets the subquery run as a covering scan of idx_cache_ts
+# (every index carries the rowid) and the delete probe rows by rowid
+_EVICT_SQL = "DELETE FROM cache WHERE rowid IN (SELECT rowid FROM cache ORDER BY ts ASC LIMIT ?)"
+
+# Let the SQLite cache overshoot max_size by this factor before evicting,
+# so eviction runs as an occasional bulk delete instead of on every write.
+_EVICTION_SLACK = 1.1
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Open a cache connection with the per-connection tuning applied."""
+    db = sqlite3.connect(db_path, check_same_thread=False)
+    # WAL-safe tuning: skip the fsync on every commit, keep temp tables
+    # in memory, and give reads a 64 MiB page cache + mmap.
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute("PRAGMA temp_store=MEMORY")
+    db.execute("PRAGMA cache_size=-65536")
+    db.execute("PRAGMA mmap_size=268435456")
+    db.execute("PRAGMA busy_timeout=3000")
+    return db
+
+
+def _check_storage_format(db: sqlite3.Connection, db_path: str) -> None:
+    """Drop a cache table written in another value encoding.
+
+    Files without the marker predate it and are treated the same way;
+    this is only a cache, so the table is simply rebuilt.
+    """
+    found = db.execute("PRAGMA user_version").fetchone()[0]
+    if found == _STORAGE_FORMAT:
+        return
+    has_table = db.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'cache'"
+    ).fetchone()
+    if has_table:
+        logger.info(
+            "SQLite cache %s has storage format %d, expected %d; rebuilding",
+            db_path,
+            found,
+            _STORAGE_FORMAT,
+        )
+        db.execute("DROP TABLE cache")
+    db.execute(f"PRAGMA user_version = {_STORAGE_FORMAT}")
+
 
 class TTLCache:
     """In-memory cache with TTL and max-size eviction.
@@ -17,11 +97,30 @@ class TTLCache:
     values are arbitrary objects.
     """
 
+    # Slots and pre-bound OrderedDict methods keep the hot get/set path
+    # free of instance-dict and method lookups.
+    __slots__ = (
+        "_ttl",
+        "_ttl_ns",
+        "_max_size",
+        "_store",
+        "_store_get",
+        "_move_to_end",
+        "_hits",
+        "_misses",
+        "_evictions",
+    )
+
     def __init__(self, ttl_seconds: float = 86400, max_size: int = 512) -> None:
         self._ttl = ttl_seconds
+        self._ttl_ns = int(ttl_seconds * 1e9)
         self._max_size = max_size
-        # OrderedDict gives us LRU ordering for free
-        self._store: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        # OrderedDict gives us LRU ordering for free; entries are
+        # (expiry deadline in monotonic ns, value) so a lookup is a
+        # single integer comparison
+        self._store: OrderedDict[str, tuple[int, Any]] = OrderedDict()
+        self._store_get = self._store.get
+        self._move_to_end = self._store.move_to_end
         self._hits = 0
         self._misses = 0
         self._evictions = 0
@@ -32,33 +131,43 @@ class TTLCache:
 
     def get(self, key: str) -> Any | None:
         """Return cached value or None if missing / expired."""
-        entry = self._store.get(key)
+        entry = self._store_get(key)
         if entry is None:
             self._misses += 1
             return None
 
-        ts, value = entry
-        if time.monotonic() - ts > self._ttl:
+        deadline, value = entry
+        if time.monotonic_ns() > deadline:
             # Expired – evict
             del self._store[key]
             self._misses += 1
             return None
 
         # Move to end (most-recently used)
-        self._store.move_to_end(key)
+        self._move_to_end(key)
         self._hits += 1
         return value
 
-    def set(self, key: str, value: Any) -> None:
-        """Store a value, evicting the oldest entry if at capacity."""
-        if key in self._store:
-            self._store.move_to_end(key)
-        self._store[key] = (time.monotonic(), value)
+    def set(self, key: str, value: Any, deadline: int | None = None) -> None:
+        """Store a value, evicting the oldest entry if at capacity.
+
+        ``deadline`` (a ``time.monotonic_ns()`` timestamp) overrides the
+        cache TTL, e.g. to expire a copy together with its source.
+        """
+        if deadline is None:
+            deadline = time.monotonic_ns() + self._ttl_ns
+        self._store[key] = (deadline, value)
+        # No-op for a fresh key; bumps an overwritten one to most-recent
+        self._move_to_end(key)
         # Evict LRU entries if over capacity
         while len(self._store) > self._max_size:
             self._store.popitem(last=False)
             self._evictions += 1
 
+    async def aset(self, key: str, value: Any) -> None:
+        """Async counterpart of :meth:`set` (in-memory, so it never blocks)."""
+        self.set(key, value)
+
     def invalidate(self, key: str) -> None:
         """Remove a specific key from the cache."""
         self._store.pop(key, None)
@@ -97,8 +206,25 @@ class TTLCache:
 class SQLiteCache:
     """Persistent cache backed by SQLite with TTL expiration.
 
-    Values are JSON-serialised. Falls back gracefully if the DB
-    is unavailable (logs a warning and acts as a no-op cache).
+    Values are JSON-serialised (stored as JSONB when the SQLite build
+    supports it). The encoding is recorded in the file's ``user_version``,
+    and a file written with the other one is emptied on open. Falls back
+    gracefully if the DB is unavailable (logs a warning and acts as a
+    no-op cache).
+
+    Writes issued inside :meth:`transaction` (or via :meth:`set_many`)
+    are buffered and committed together, so bulk population costs one
+    commit instead of one per entry.
+
+    ``max_size`` is a soft limit: the table may grow up to 10% past it
+    before the oldest entries are evicted in one batch.
+
+    Reads and writes use separate connections. Writes are serialised by
+    a lock, so :meth:`aset` can run them on a worker thread while
+    :meth:`get` keeps reading committed data on the event loop (WAL
+    lets readers proceed during commits and checkpoints). A transaction
+    belongs to the thread that opened it; writes from other threads
+    commit immediately as usual.
     """
 
     def __init__(
@@ -108,43 +234,136 @@ class SQLiteCache:
         max_size: int = 2048,
     ) -> None:
         self._ttl = ttl_seconds
+        self._ttl_ns = int(ttl_seconds * 1e9)
         self._max_size = max_size
         self._hits = 0
         self._misses = 0
         self._evictions = 0
+        # _db is the single write connection; _reader serves get()
         self._db: sqlite3.Connection | None = None
+        self._reader: sqlite3.Connection | None = None
+        self._write_lock = threading.Lock()
+        # Per-thread state; ``batch`` holds the open transaction's buffered
+        # writes as (key, value, ts in ns), or is absent outside one
+        self._local = threading.local()
+        # Upper bound on the row count (overwrites are counted as inserts);
+        # reconciled with COUNT(*) only when it crosses the eviction threshold
+        self._approx_count = 0
 
         try:
-            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db = _connect(db_path)
             self._db.execute("PRAGMA journal_mode=WAL")
+            _check_storage_format(self._db, db_path)
             self._db.execute(
-                """
+                f"""
                 CREATE TABLE IF NOT EXISTS cache (
                     key   TEXT PRIMARY KEY,
-                    value TEXT NOT NULL,
-                    ts    REAL NOT NULL
+                    value {_VALUE_TYPE} NOT NULL,
+                    ts    INTEGER NOT NULL
                 )
                 """
             )
             self._db.execute("CREATE INDEX IF NOT EXISTS idx_cache_ts ON cache(ts)")
             self._db.commit()
+            self._approx_count = self._db.execute(_COUNT_SQL).fetchone()[0]
+            # An in-memory database is private to its connection
+            self._reader = self._db if db_path == ":memory:" else _connect(db_path)
             logger.info("SQLite cache opened: %s", db_path)
         except sqlite3.Error as exc:
             logger.warning("Failed to open SQLite cache at %s: %s", db_path, exc)
             self._db = None
+            self._reader = None
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
     def get(self, key: str) -> Any | None:
+        entry = self._lookup(key)
+        return None if entry is None else entry[0]
+
+    def set(self, key: str, value: Any) -> None:
         if self._db is None:
+            return
+        try:
+            data = _encode_value(value)
+        except TypeError as exc:
+            logger.debug("SQLite cache set failed: %s", exc)
+            return
+        entry = (key, data, time.time_ns())
+        batch = getattr(self._local, "batch", None)
+        if batch is not None:
+            # Only this thread touches its own batch, so no lock is needed
+            batch.append(entry)
+        else:
+            self._write([entry])
+
+    async def aset(self, key: str, value: Any) -> None:
+        """Like :meth:`set`, but commits on a worker thread.
+
+        Keeps the event loop responsive while SQLite commits or
+        checkpoints the WAL.
+        """
+        await asyncio.to_thread(self.set, key, value)
+
+    def set_many(self, items: Iterable[tuple[str, Any]]) -> None:
+        """Store several ``(key, value)`` pairs with a single commit."""
+        with self.transaction():
+            for key, value in items:
+                self.set(key, value)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Buffer writes made inside the block and commit them once on exit.
+
+        Nested blocks join the outermost one. Buffered writes are not
+        visible to :meth:`get` until the block exits. Only writes made on
+        the calling thread are buffered.
+        """
+        if getattr(self._local, "batch", None) is not None:
+            yield
+            return
+        batch: list[tuple[str, str | bytes, int]] = []
+        self._local.batch = batch
+        try:
+            yield
+        finally:
+            self._local.batch = None
+            self._write(batch)
+
+    def invalidate(self, key: str) -> None:
+        if self._db is None:
+            return
+        with self._write_lock:
+            try:
+                self._db.execute(_DELETE_SQL, (key,))
+                self._db.commit()
+            except sqlite3.Error:
+                pass
+
+    def clear(self) -> None:
+        if self._db is None:
+            return
+        with self._write_lock:
+            try:
+                self._db.execute("DELETE FROM cache")
+                self._db.commit()
+                self._approx_count = 0
+            except sqlite3.Error:
+                pass
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _lookup(self, key: str) -> tuple[Any, int] | None:
+        """Return ``(value, remaining lifetime in ns)``, or None on a miss."""
+        if self._reader is None:
             self._misses += 1
             return None
+
         try:
-            row = self._db.execute(
-                "SELECT value, ts FROM cache WHERE key = ?", (key,)
-            ).fetchone()
+            row = self._reader.execute(_SELECT_SQL, (key,)).fetchone()
         except sqlite3.Error:
             self._misses += 1
             return None
@@ -153,76 +372,55 @@ class SQLiteCache:
             self._misses += 1
             return None
 
-        value_str, ts = row
-        if time.time() - ts > self._ttl:
-            # Expired
-            try:
-                self._db.execute("DELETE FROM cache WHERE key = ?", (key,))
-                self._db.commit()
-            except sqlite3.Error:
-                pass
+        data, ts = row
+        remaining = ts + self._ttl_ns - time.time_ns()
+        if remaining < 0:
+            # Expired – left for the next set() or eviction pass to replace,
+            # so reads never wait on the write lock
             self._misses += 1
             return None
 
-        self._hits += 1
         try:
-            return json.loads(value_str)
+            value = json_loads(data)
         except (json.JSONDecodeError, TypeError):
-            return value_str
-
-    def set(self, key: str, value: Any) -> None:
-        if self._db is None:
-            return
-        try:
-            value_str = json.dumps(value) if not isinstance(value, str) else value
-            self._db.execute(
-                "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)",
-                (key, value_str, time.time()),
-            )
-            self._db.commit()
-            self._enforce_max_size()
-        except (sqlite3.Error, TypeError) as exc:
-            logger.debug("SQLite cache set failed: %s", exc)
+            self._misses += 1
+            return None
+        self._hits += 1
+        return value, remaining
 
-    def invalidate(self, key: str) -> None:
-        if self._db is None:
+    def _write(self, entries: list[tuple[str, str | bytes, int]]) -> None:
+        """Insert ``entries`` and evict overflow in one transaction."""
+        if self._db is None or not entries:
             return
-        try:
-            self._db.execute("DELETE FROM cache WHERE key = ?", (key,))
-            self._db.commit()
-        except sqlite3.Error:
-            pass
-
-    def clear(self) -> None:
-        if self._db is None:
-            return
-        try:
-            self._db.execute("DELETE FROM cache")
-            self._db.commit()
-        except sqlite3.Error:
-            pass
-
-    # ------------------------------------------------------------------
-    # Internal
-    # ------------------------------------------------------------------
+        with self._write_lock:
+            try:
+                self._db.executemany(_INSERT_SQL, entries)
+                self._approx_count += len(entries)
+                if self._approx_count > self._max_size * _EVICTION_SLACK:
+                    self._enforce_max_size()
+                self._db.commit()
+            except sqlite3.Error as exc:
+                logger.debug("SQLite cache write failed: %s", exc)
+                try:
+                    self._db.rollback()
+                except sqlite3.Error:
+                    pass
 
     def _enforce_max_size(self) -> None:
-        """Evict oldest entries if over capacity."""
+        """Evict oldest entries if over capacity.
+
+        Runs inside the caller's transaction with the write lock held;
+        the caller commits.
+        """
         if self._db is None:
             return
-        try:
-            count = self._db.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
-            if count > self._max_size:
-                excess = count - self._max_size
-                self._db.execute(
-                    "DELETE FROM cache WHERE key IN "
-                    "(SELECT key FROM cache ORDER BY ts ASC LIMIT ?)",
-                    (excess,),
-                )
-                self._db.commit()
-                self._evictions += excess
-        except sqlite3.Error:
-            pass
+        count = self._db.execute(_COUNT_SQL).fetchone()[0]
+        if count > self._max_size:
+            excess = count - self._max_size
+            self._db.execute(_EVICT_SQL, (excess,))
+            self._evictions += excess
+            count = self._max_size
+        self._approx_count = count
 
     # ------------------------------------------------------------------
     # Diagnostics
@@ -230,10 +428,12 @@ class SQLiteCache:
 
     @property
     def size(self) -> int:
-        if self._db is None:
+        # Counted on the read connection, so a stats call never waits
+        # behind a commit that holds the write lock
+        if self._reader is None:
             return 0
         try:
-            return self._db.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+            return self._reader.execute(_COUNT_SQL).fetchone()[0]
         except sqlite3.Error:
             return 0
 
@@ -256,14 +456,93 @@ class SQLiteCache:
         }
 
 
+class TieredCache:
+    """In-memory L1 in front of a persistent SQLite L2.
+
+    Reads check L1 first and fall through to SQLite, promoting hits into
+    L1; writes go to both tiers. A promoted entry keeps the remaining
+    lifetime of its SQLite row, so L1 never outlives the persistent copy.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "inspirehep_cache.db",
+        ttl_seconds: float = 86400,
+        max_size: int = 2048,
+        l1_size: int = 64,
+    ) -> None:
+        self._l1 = TTLCache(ttl_seconds=ttl_seconds, max_size=l1_size)
+        self._l2 = SQLiteCache(db_path=db_path, ttl_seconds=ttl_seconds, max_size=max_size)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Any | None:
+        value = self._l1.get(key)
+        if value is not None:
+            return value
+        entry = self._l2._lookup(key)
+        if entry is None:
+            return None
+        value, remaining = entry
+        self._l1.set(key, value, deadline=time.monotonic_ns() + remaining)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._l1.set(key, value)
+        self._l2.set(key, value)
+
+    async def aset(self, key: str, value: Any) -> None:
+        self._l1.set(key, value)
+        await self._l2.aset(key, value)
+
+    def invalidate(self, key: str) -> None:
+        self._l1.invalidate(key)
+        self._l2.invalidate(key)
+
+    def clear(self) -> None:
+        self._l1.clear()
+        self._l2.clear()
+
+    # ------------------------------------------------------------------
+    # Diagnostics
+    # ------------------------------------------------------------------
+
+    @property
+    def size(self) -> int:
+        return self._l2.size
+
+    @property
+    def hit_rate(self) -> float:
+        # Every lookup reaches L1; L1 misses are retried against L2
+        hits = self._l1._hits + self._l2._hits
+        total = self._l1._hits + self._l1._misses
+        return (hits / total * 100) if total > 0 else 0.0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": "tiered",
+            "size": self.size,
+            "max_size": self._l2._max_size,
+            "ttl_seconds": self._l2._ttl,
+            "hits": self._l1._hits + self._l2._hits,
+            "misses": self._l2._misses,
+            "hit_rate_percent": round(self.hit_rate, 1),
+            "l1": self._l1.stats,
+            "l2": self._l2.stats,
+        }
+
+
 def create_cache(
     *,
     persistent: bool = False,
     db_path: str = "inspirehep_cache.db",
     ttl_seconds: float = 86400,
     max_size: int = 512,
-) -> TTLCache | SQLiteCache:
+) -> TTLCache | TieredCache:
     """Factory function to create the appropriate cache backend."""
     if persistent:
-        return SQLiteCache(db_path=db_path, ttl_seconds=ttl_seconds, max_size=max_size)
+        return TieredCache(db_path=db_path, ttl_seconds=ttl_seconds, max_size=max_size)
     return TTLCache(ttl_seconds=ttl_seconds, max_size=max_size)
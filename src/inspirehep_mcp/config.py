@@ -5,6 +5,7 @@ All env vars are prefixed with ``INSPIREHEP_``.
 """
 
 import os
+from dataclasses import dataclass, field
 
 
 def _env_float(key: str, default: float) -> float:
@@ -28,25 +29,41 @@ def _env_str(key: str, default: str) -> str:
     return os.environ.get(key, default)
 
 
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Centralised configuration for the MCP server."""
+    """Centralised configuration for the MCP server.
+
+    Environment variables are read once, when the instance is created.
+    """
 
     # API
-    api_base_url: str = _env_str("INSPIREHEP_API_BASE_URL", "https://inspirehep.net/api")
-    api_timeout: float = _env_float("INSPIREHEP_API_TIMEOUT", 30.0)
-    requests_per_second: float = _env_float("INSPIREHEP_REQUESTS_PER_SECOND", 1.5)
+    api_base_url: str = field(
+        default_factory=lambda: _env_str("INSPIREHEP_API_BASE_URL", "https://inspirehep.net/api")
+    )
+    api_timeout: float = field(default_factory=lambda: _env_float("INSPIREHEP_API_TIMEOUT", 30.0))
+    requests_per_second: float = field(
+        default_factory=lambda: _env_float("INSPIREHEP_REQUESTS_PER_SECOND", 1.5)
+    )
 
     # Cache — in-memory
-    cache_ttl: float = _env_float("INSPIREHEP_CACHE_TTL", 86400.0)
-    cache_max_size: int = _env_int("INSPIREHEP_CACHE_MAX_SIZE", 512)
+    cache_ttl: float = field(default_factory=lambda: _env_float("INSPIREHEP_CACHE_TTL", 86400.0))
+    cache_max_size: int = field(default_factory=lambda: _env_int("INSPIREHEP_CACHE_MAX_SIZE", 512))
 
     # Cache — persistent (SQLite)
-    cache_persistent: bool = _env_bool("INSPIREHEP_CACHE_PERSISTENT", False)
-    cache_db_path: str = _env_str("INSPIREHEP_CACHE_DB_PATH", "inspirehep_cache.db")
+    cache_persistent: bool = field(
+        default_factory=lambda: _env_bool("INSPIREHEP_CACHE_PERSISTENT", False)
+    )
+    cache_db_path: str = field(
+        default_factory=lambda: _env_str("INSPIREHEP_CACHE_DB_PATH", "inspirehep_cache.db")
+    )
 
     # Logging
-    log_level: str = _env_str("INSPIREHEP_LOG_LEVEL", "INFO")
+    log_level: str = field(default_factory=lambda: _env_str("INSPIREHEP_LOG_LEVEL", "INFO"))
 
 
 # Singleton
 settings = Settings()
+
+# Tool output is consumed by an LLM, so it is emitted compact; indentation
+# only helps a human reading it, i.e. when debugging.
+PRETTY_JSON = settings.log_level.upper() == "DEBUG"
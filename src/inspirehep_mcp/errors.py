@@ -4,6 +4,8 @@ All exceptions include an ``suggestion`` field with actionable advice
 suitable for display to an LLM or end user.
 """
 
+from types import MappingProxyType
+
 
 class InspireHEPError(Exception):
     """Base exception for all InspireHEP errors."""
@@ -54,9 +56,8 @@ class APIError(InspireHEPError):
         return " — ".join(parts)
 
 
-def _api_suggestion(status_code: int) -> str:
-    """Return a user-friendly suggestion based on HTTP status code."""
-    suggestions = {
+_API_SUGGESTIONS = MappingProxyType(
+    {
         400: "Check the query syntax. InspireHEP uses SPIRES-style search syntax.",
         403: "Access denied. This resource may require special permissions.",
         404: "The record was not found. Verify the identifier is correct.",
@@ -65,7 +66,13 @@ def _api_suggestion(status_code: int) -> str:
         502: "InspireHEP is temporarily unavailable. Try again shortly.",
         503: "InspireHEP is under maintenance. Try again later.",
     }
-    return suggestions.get(status_code, "An unexpected API error occurred. Try again later.")
+)
+_DEFAULT_API_SUGGESTION = "An unexpected API error occurred. Try again later."
+
+
+def _api_suggestion(status_code: int) -> str:
+    """Return a user-friendly suggestion based on HTTP status code."""
+    return _API_SUGGESTIONS.get(status_code, _DEFAULT_API_SUGGESTION)
 
 
 class RateLimitError(APIError):
@@ -106,12 +113,14 @@ class NotFoundError(APIError):
 class InvalidIdentifierError(InspireHEPError):
     """An identifier (arXiv ID, DOI, Inspire ID) is malformed."""
 
-    _FORMAT_HINTS = {
-        "arXiv": "Expected formats: '2301.12345', 'hep-ph/0123456', or 'https://arxiv.org/abs/...'",
-        "DOI": "Expected format: '10.XXXX/...' or 'https://doi.org/10.XXXX/...'",
-        "Inspire": "Expected format: a numeric ID like '3456' or '1234567'",
-        "unknown": "Provide an arXiv ID, DOI, or numeric Inspire ID.",
-    }
+    _FORMAT_HINTS = MappingProxyType(
+        {
+            "arXiv": "Expected formats: '2301.12345', 'hep-ph/0123456', or 'https://arxiv.org/abs/...'",
+            "DOI": "Expected format: '10.XXXX/...' or 'https://doi.org/10.XXXX/...'",
+            "Inspire": "Expected format: a numeric ID like '3456' or '1234567'",
+            "unknown": "Provide an arXiv ID, DOI, or numeric Inspire ID.",
+        }
+    )
 
     def __init__(self, id_type: str, value: str) -> None:
         self.id_type = id_type
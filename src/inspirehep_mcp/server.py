@@ -1,18 +1,19 @@
 """InspireHEP MCP Server - main entry point."""
 
-import json
 import logging
 
 from mcp.server.fastmcp import FastMCP
 
 from .api_client import InspireHEPClient
-from .config import settings
+from .config import PRETTY_JSON, settings
 from .tools import get_author_papers as _get_author_papers
 from .tools import get_citations as _get_citations
 from .tools import get_paper_details as _get_paper_details
 from .tools import get_references as _get_references
 from .tools import search_by_collaboration as _search_by_collaboration
 from .tools import search_papers as _search_papers
+from .tools import tool_cache_stats
+from .utils import json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +44,8 @@ async def server_stats() -> str:
     Useful for monitoring cache hit rates, request counts, and
     average response times. No parameters required.
     """
-    return json.dumps(api_client.full_stats, indent=2)
+    stats = {**api_client.full_stats, "tool_caches": tool_cache_stats()}
+    return json_dumps(stats, pretty=PRETTY_JSON)
 
 
 @mcp.tool()
@@ -76,7 +78,8 @@ async def get_paper_details(
 ) -> str:
     """Retrieve detailed metadata for a specific paper.
 
-    Provide at least one identifier. Accepts multiple formats:
+    Provide at least one identifier; if several are given, the first
+    that resolves is used. Accepts multiple formats:
     - inspire_id: "3456"
     - arxiv_id: "2301.12345", "hep-ph/0123456", or full URL
     - doi: "10.1103/PhysRevLett.123.456789" or full URL
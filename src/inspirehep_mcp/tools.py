@@ -1,14 +1,19 @@
 """MCP tools for InspireHEP literature discovery and analysis."""
 
-import json
+import asyncio
 import logging
 from collections import Counter
 from typing import Any
 
 from .api_client import InspireHEPClient
+from .cache import TTLCache
+from .config import PRETTY_JSON, settings
 from .errors import APIError, InspireHEPError, InvalidIdentifierError, NotFoundError
 from .utils import (
+    INSPIRE_LITERATURE_URL,
+    PaperMetadata,
     detect_identifier_type,
+    json_dumps,
     normalize_arxiv_id,
     normalize_doi,
     normalize_inspire_id,
@@ -20,13 +25,37 @@ logger = logging.getLogger(__name__)
 
 def _format_error(err: Exception) -> str:
     """Format an exception into a user-friendly error string."""
-    return json.dumps({"error": str(err)})
+    return json_dumps({"error": str(err)})
+
+
+# Parsed summaries shared across requests: author, collaboration and citation
+# listings overlap heavily. Keyed on the record's ``updated`` stamp and
+# citation count so edits and new citations are picked up. Entries are
+# shared, so callers must copy one before mutating it.
+_PARSED_CACHE = TTLCache(ttl_seconds=settings.cache_ttl, max_size=2048)
+
+
+def _parse_record(record: dict) -> PaperMetadata:
+    """Memoised :func:`parse_paper_metadata`; records without an id bypass it."""
+    record_id = record.get("id")
+    if record_id is None:
+        return parse_paper_metadata(record)
+    citations = record.get("metadata", {}).get("citation_count")
+    key = f"{record_id}:{record.get('updated')}:{citations}"
+    parsed = _PARSED_CACHE.get(key)
+    if parsed is None:
+        parsed = parse_paper_metadata(record)
+        _PARSED_CACHE.set(key, parsed)
+    return parsed
 
 
 # ======================================================================
 # search_papers
 # ======================================================================
 
+_VALID_SORTS: frozenset[str] = frozenset({"bestmatch", "mostrecent", "mostcited"})
+
+
 async def search_papers(
     client: InspireHEPClient,
     query: str,
@@ -48,10 +77,9 @@ async def search_papers(
         JSON string with results for the LLM.
     """
     # Validate sort
-    valid_sorts = {"bestmatch", "mostrecent", "mostcited"}
-    if sort not in valid_sorts:
+    if sort not in _VALID_SORTS:
         return _format_error(
-            ValueError(f"Invalid sort option '{sort}'. Must be one of: {', '.join(valid_sorts)}")
+            ValueError(f"Invalid sort option '{sort}'. Must be one of: {', '.join(_VALID_SORTS)}")
         )
 
     # Clamp size
@@ -66,7 +94,7 @@ async def search_papers(
     total = hits.get("total", 0)
     records = hits.get("hits", [])
 
-    papers = [parse_paper_metadata(r) for r in records]
+    papers = [_parse_record(r) for r in records]
 
     result: dict[str, Any] = {
         "total_results": total,
@@ -75,7 +103,7 @@ async def search_papers(
         "sort": sort,
         "papers": papers,
     }
-    return json.dumps(result, indent=2)
+    return json_dumps(result, pretty=PRETTY_JSON)
 
 
 # ======================================================================
@@ -110,82 +138,116 @@ _DETAIL_FIELDS = ",".join(
 )
 
 
+# External URL prefixes; identifiers are appended by concatenation
+_ARXIV_ABS_URL = "https://arxiv.org/abs/"
+_ARXIV_PDF_URL = "https://arxiv.org/pdf/"
+_DOI_URL = "https://doi.org/"
+
+# ``schema`` of the INSPIRE author identifier (BAI) in author ``ids`` lists
+_INSPIRE_BAI_SCHEMA = "INSPIRE BAI"
+
+
 def _build_detail_response(record: dict) -> dict[str, Any]:
     """Build a rich detail dict from a full API record."""
-    base = parse_paper_metadata(record)
+    # Copied: the parsed summary may be shared through _PARSED_CACHE
+    base: dict[str, Any] = dict(_parse_record(record))
     meta = record.get("metadata", {})
-
-    # Expand author list for detail view (up to 50)
-    raw_authors = meta.get("authors", [])
-    base["authors"] = [
-        {
-            "full_name": a.get("full_name", ""),
-            "affiliations": [
-                aff.get("value", "") for aff in a.get("affiliations", [])
-            ],
-            "inspire_ids": [
-                i.get("value", "")
-                for i in a.get("ids", [])
-                if i.get("schema") == "INSPIRE BAI"
-            ],
-        }
-        for a in raw_authors[:50]
-    ]
+    meta_get = meta.get
+
+    # Expand author list for detail view (up to 50); one pass per author,
+    # skipping the inner comprehensions when a field is absent
+    raw_authors = meta_get("authors", [])
+    authors = []
+    for a in raw_authors[:50]:
+        affs = a.get("affiliations")
+        ids = a.get("ids")
+        bais = [i.get("value", "") for i in ids if i.get("schema") == _INSPIRE_BAI_SCHEMA] if ids else []
+        authors.append(
+            {
+                "full_name": a.get("full_name", ""),
+                "affiliations": [aff.get("value", "") for aff in affs] if affs else [],
+                "inspire_ids": bais,
+            }
+        )
+    base["authors"] = authors
     base["total_authors"] = len(raw_authors)
 
     # References summary
-    refs = meta.get("references", [])
-    base["references_count"] = len(refs)
+    base["references_count"] = len(meta_get("references", []))
 
     # Citation counts
-    base["citation_count_without_self_citations"] = meta.get(
+    base["citation_count_without_self_citations"] = meta_get(
         "citation_count_without_self_citations", 0
     )
 
     # Document type
-    base["document_type"] = meta.get("document_type", [])
+    base["document_type"] = meta_get("document_type", [])
 
     # Keywords
-    keywords = meta.get("keywords", [])
-    base["keywords"] = [k.get("value", "") for k in keywords if k.get("value")]
+    base["keywords"] = [v for k in meta_get("keywords", []) if (v := k.get("value"))]
 
     # Inspire categories
-    categories = meta.get("inspire_categories", [])
-    base["inspire_categories"] = [c.get("term", "") for c in categories]
+    base["inspire_categories"] = [c.get("term", "") for c in meta_get("inspire_categories", [])]
 
     # TeXkeys
-    texkeys = meta.get("texkeys", [])
+    texkeys = meta_get("texkeys")
     base["texkey"] = texkeys[0] if texkeys else None
 
     # Report numbers
-    report_numbers = meta.get("report_numbers", [])
-    base["report_numbers"] = [r.get("value", "") for r in report_numbers]
+    base["report_numbers"] = [r.get("value", "") for r in meta_get("report_numbers", [])]
 
     # Number of pages
-    base["number_of_pages"] = meta.get("number_of_pages")
+    base["number_of_pages"] = meta_get("number_of_pages")
+
+    base["urls"] = _build_urls(base, meta_get("documents"), record.get("links", {}))
 
-    # URLs
+    return base
+
+
+def _build_urls(
+    base: dict[str, Any],
+    docs: list[dict] | None,
+    links: dict[str, str],
+) -> dict[str, str | None]:
+    """Collect external links for a paper from its parsed metadata."""
     urls: dict[str, str | None] = {}
     arxiv_id = base.get("arxiv_id")
     if arxiv_id:
-        urls["arxiv_abs"] = f"https://arxiv.org/abs/{arxiv_id}"
-        urls["arxiv_pdf"] = f"https://arxiv.org/pdf/{arxiv_id}"
+        urls["arxiv_abs"] = _ARXIV_ABS_URL + arxiv_id
+        urls["arxiv_pdf"] = _ARXIV_PDF_URL + arxiv_id
     doi = base.get("doi")
     if doi:
-        urls["doi"] = f"https://doi.org/{doi}"
-    docs = meta.get("documents", [])
+        urls["doi"] = _DOI_URL + doi
     if docs:
         urls["fulltext"] = docs[0].get("url")
     urls["inspire"] = base["inspire_url"]
 
     # Links from API (bibtex, latex, etc.)
-    links = record.get("links", {})
     if links.get("bibtex"):
         urls["bibtex"] = links["bibtex"]
 
-    base["urls"] = urls
+    return urls
 
-    return base
+
+async def _first_successful(tasks: list[asyncio.Task[dict[str, Any]]]) -> dict[str, Any]:
+    """Return the result of the first task to succeed and cancel the rest.
+
+    ``tasks`` is in priority order: when several succeed together the
+    earliest one wins, and if all fail the first task's error is raised.
+    """
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # Check every finished task so no exception goes unretrieved
+            succeeded = [t for t in done if t.exception() is None]
+            if succeeded:
+                return min(succeeded, key=tasks.index).result()
+    finally:
+        for task in pending:
+            task.cancel()
+    # Every lookup failed; result() re-raises the top-priority error
+    return tasks[0].result()
 
 
 async def get_paper_details(
@@ -196,8 +258,9 @@ async def get_paper_details(
 ) -> str:
     """Retrieve detailed metadata for a specific paper.
 
-    At least one identifier must be provided. The lookup order is:
-    inspire_id > arxiv_id > doi.
+    At least one identifier must be provided. When several are given
+    they are looked up concurrently and the first match wins; results
+    arriving together are ranked inspire_id > arxiv_id > doi.
 
     Args:
         client: The shared API client.
@@ -208,46 +271,87 @@ async def get_paper_details(
     Returns:
         JSON string with full paper details for the LLM.
     """
-    if not any([inspire_id, arxiv_id, doi]):
+    if not inspire_id and not arxiv_id and not doi:
         return _format_error(
             ValueError("At least one identifier must be provided (inspire_id, arxiv_id, or doi)")
         )
 
+    # Normalise every identifier given; malformed ones are only reported
+    # if none of the others are usable
+    lookups = []
+    invalid: list[InvalidIdentifierError] = []
+    for raw, normalize, fetch in (
+        (inspire_id, normalize_inspire_id, client.get_literature_record),
+        (arxiv_id, normalize_arxiv_id, client.get_literature_by_arxiv),
+        (doi, normalize_doi, client.get_literature_by_doi),
+    ):
+        if not raw:
+            continue
+        try:
+            lookups.append((raw, fetch, normalize(raw)))
+        except InvalidIdentifierError as exc:
+            invalid.append(exc)
+    if not lookups:
+        return _format_error(invalid[0])
+
+    tasks = [
+        asyncio.create_task(fetch(nid, fields=_DETAIL_FIELDS)) for _, fetch, nid in lookups
+    ]
     try:
-        if inspire_id:
-            nid = normalize_inspire_id(inspire_id)
-            record = await client.get_literature_record(nid, fields=_DETAIL_FIELDS)
-        elif arxiv_id:
-            nid = normalize_arxiv_id(arxiv_id)
-            record = await client.get_literature_by_arxiv(nid, fields=_DETAIL_FIELDS)
-        else:
-            assert doi is not None
-            nid = normalize_doi(doi)
-            record = await client.get_literature_by_doi(nid, fields=_DETAIL_FIELDS)
+        record = await _first_successful(tasks)
     except NotFoundError:
-        identifier = inspire_id or arxiv_id or doi
-        return _format_error(NotFoundError("paper", str(identifier)))
-    except (InvalidIdentifierError, InspireHEPError) as exc:
+        return _format_error(NotFoundError("paper", lookups[0][0]))
+    except InspireHEPError as exc:
         return _format_error(exc)
 
     detail = _build_detail_response(record)
-    return json.dumps(detail, indent=2)
+    return json_dumps(detail, pretty=PRETTY_JSON)
 
 
 # ======================================================================
 # get_author_papers
 # ======================================================================
 
-def _compute_h_index(citation_counts: list[int]) -> int:
-    """Compute the h-index from a list of citation counts."""
-    sorted_counts = sorted(citation_counts, reverse=True)
-    h = 0
-    for i, c in enumerate(sorted_counts):
-        if c >= i + 1:
-            h = i + 1
-        else:
-            break
-    return h
+# Sorts accepted by the author and collaboration listings (no relevance rank)
+_VALID_LISTING_SORTS: frozenset[str] = frozenset({"mostrecent", "mostcited"})
+
+
+def _citation_metrics(papers: list[PaperMetadata]) -> tuple[int, int]:
+    """Return ``(total_citations, h_index)`` for parsed papers in one pass.
+
+    The h-index uses a counting sort: citations above ``n`` can never raise
+    h past ``n``, so counts are bucketed into ``min(c, n)`` and scanned from
+    the top.
+    """
+    n = len(papers)
+    buckets = [0] * (n + 1)
+    total = 0
+    for p in papers:
+        c = p.get("citation_count", 0)
+        total += c
+        buckets[min(c, n)] += 1
+    at_least = 0
+    for i in range(n, 0, -1):
+        at_least += buckets[i]
+        if at_least >= i:
+            return total, i
+    return total, 0
+
+
+# Successful name → (bai, author_info) resolutions, keyed by the casefolded
+# name. BAIs are stable, and the raw-name fallback is never stored so a
+# transient API failure is retried on the next call. Like _PARSED_CACHE this
+# is process-wide: it uses the configured INSPIREHEP_CACHE_TTL, not the TTL
+# of whichever client is passed in, and is reported by tool_cache_stats().
+_BAI_CACHE = TTLCache(ttl_seconds=settings.cache_ttl, max_size=1024)
+
+
+def tool_cache_stats() -> dict[str, Any]:
+    """Statistics for the process-wide caches kept by the tools themselves."""
+    return {
+        "parsed_records": _PARSED_CACHE.stats,
+        "author_bai": _BAI_CACHE.stats,
+    }
 
 
 async def _resolve_author_bai(client: InspireHEPClient, author_name: str) -> tuple[str, dict[str, Any]]:
@@ -256,6 +360,12 @@ async def _resolve_author_bai(client: InspireHEPClient, author_name: str) -> tup
     Returns (bai_string, author_info_dict).
     Falls back to the raw name if no match is found.
     """
+    key = author_name.strip().casefold()
+    cached = _BAI_CACHE.get(key)
+    if cached is not None:
+        bai, author_info = cached
+        return bai, dict(author_info)
+
     try:
         result = await client.search_authors(author_name, size=1)
         hits = result.get("hits", {}).get("hits", [])
@@ -264,16 +374,17 @@ async def _resolve_author_bai(client: InspireHEPClient, author_name: str) -> tup
             name_info = meta.get("name", {})
             # Extract BAI
             ids = meta.get("ids", [])
-            bai_entries = [i for i in ids if i.get("schema") == "INSPIRE BAI"]
-            if bai_entries:
-                bai = bai_entries[0]["value"]
+            bai_entry = next((i for i in ids if i.get("schema") == _INSPIRE_BAI_SCHEMA), None)
+            if bai_entry:
+                bai = bai_entry["value"]
                 author_info = {
                     "name": name_info.get("value", author_name),
                     "preferred_name": name_info.get("preferred_name", ""),
                     "bai": bai,
                     "inspire_author_id": str(hits[0].get("id", "")),
                 }
-                return bai, author_info
+                _BAI_CACHE.set(key, (bai, author_info))
+                return bai, dict(author_info)
     except InspireHEPError:
         pass  # Fall back to raw name
 
@@ -305,28 +416,25 @@ async def get_author_papers(
     Returns:
         JSON string with publication list and aggregate metrics.
     """
-    if not any([author_name, author_id]):
-        return _format_error(
-            ValueError("Either author_name or author_id must be provided")
-        )
-
-    valid_sorts = {"mostrecent", "mostcited"}
-    if sort not in valid_sorts:
+    if sort not in _VALID_LISTING_SORTS:
         return _format_error(
-            ValueError(f"Invalid sort option '{sort}'. Must be one of: {', '.join(valid_sorts)}")
+            ValueError(f"Invalid sort option '{sort}'. Must be one of: {', '.join(_VALID_LISTING_SORTS)}")
         )
 
     size = max(1, min(size, 100))
 
     # Resolve author to BAI for accurate results
-    author_info: dict[str, Any] = {}
+    author_info: dict[str, Any]
     if author_id:
         query = f"a {author_id}"
         author_info = {"bai": author_id}
-    else:
-        assert author_name is not None
+    elif author_name:
         bai, author_info = await _resolve_author_bai(client, author_name)
         query = f"a {bai}"
+    else:
+        return _format_error(
+            ValueError("Either author_name or author_id must be provided")
+        )
 
     try:
         raw = await client.search_literature(query, sort=sort, size=size)
@@ -337,12 +445,10 @@ async def get_author_papers(
     total = hits.get("total", 0)
     records = hits.get("hits", [])
 
-    papers = [parse_paper_metadata(r) for r in records]
+    papers = [_parse_record(r) for r in records]
 
     # Aggregate metrics from returned papers
-    citation_counts = [p.get("citation_count", 0) for p in papers]
-    total_citations = sum(citation_counts)
-    h_index = _compute_h_index(citation_counts)
+    total_citations, h_index = _citation_metrics(papers)
 
     result: dict[str, Any] = {
         "author": author_info,
@@ -361,7 +467,7 @@ async def get_author_papers(
         },
         "papers": papers,
     }
-    return json.dumps(result, indent=2)
+    return json_dumps(result, pretty=PRETTY_JSON)
 
 
 # ======================================================================
@@ -416,7 +522,7 @@ async def get_citations(
     total = hits.get("total", 0)
     records = hits.get("hits", [])
 
-    papers = [parse_paper_metadata(r) for r in records]
+    papers = [_parse_record(r) for r in records]
 
     # Build citation timeline (year → count)
     year_counts: Counter[str] = Counter()
@@ -434,7 +540,7 @@ async def get_citations(
         "timeline": timeline,
         "papers": papers,
     }
-    return json.dumps(result, indent=2)
+    return json_dumps(result, pretty=PRETTY_JSON)
 
 
 # ======================================================================
@@ -495,10 +601,9 @@ async def search_by_collaboration(
     Returns:
         JSON string with collaboration publications, stats, and key papers.
     """
-    valid_sorts = {"mostrecent", "mostcited"}
-    if sort not in valid_sorts:
+    if sort not in _VALID_LISTING_SORTS:
         return _format_error(
-            ValueError(f"Invalid sort option '{sort}'. Must be one of: {', '.join(valid_sorts)}")
+            ValueError(f"Invalid sort option '{sort}'. Must be one of: {', '.join(_VALID_LISTING_SORTS)}")
         )
 
     size = max(1, min(size, 100))
@@ -518,7 +623,7 @@ async def search_by_collaboration(
     total = hits.get("total", 0)
     records = hits.get("hits", [])
 
-    papers = [parse_paper_metadata(r) for r in records]
+    papers = [_parse_record(r) for r in records]
 
     # Identify top-cited papers from the returned set
     top_cited = sorted(papers, key=lambda p: p.get("citation_count", 0), reverse=True)[:5]
@@ -552,7 +657,7 @@ async def search_by_collaboration(
         ],
         "papers": papers,
     }
-    return json.dumps(result, indent=2)
+    return json_dumps(result, pretty=PRETTY_JSON)
 
 
 # ======================================================================
@@ -611,7 +716,7 @@ async def get_references(
             "references": "",
             "note": "This paper has no references in InspireHEP.",
         }
-        return json.dumps(result, indent=2)
+        return json_dumps(result, pretty=PRETTY_JSON)
 
     # Extract reference record IDs
     ref_recids: list[str] = []
@@ -635,7 +740,7 @@ async def get_references(
             if rec_ref:
                 parts = rec_ref.rstrip("/").split("/")
                 entry["inspire_id"] = parts[-1] if parts else None
-                entry["inspire_url"] = f"https://inspirehep.net/literature/{parts[-1]}"
+                entry["inspire_url"] = INSPIRE_LITERATURE_URL + parts[-1]
 
             # Publication info from reference
             pub = refinfo.get("publication_info", {})
@@ -677,7 +782,7 @@ async def get_references(
             "format": "json",
             "references": ref_data,
         }
-        return json.dumps(result, indent=2)
+        return json_dumps(result, pretty=PRETTY_JSON)
 
     # For bibtex / latex formats, fetch from the API for each referenced paper
     # Use the API's built-in formatting by fetching BibTeX for the paper's references
@@ -703,4 +808,4 @@ async def get_references(
         "format": format,
         "references": formatted_text,
     }
-    return json.dumps(result, indent=2)
+    return json_dumps(result, pretty=PRETTY_JSON)
@@ -1,49 +1,120 @@
-"""Utility functions for ID normalization and response parsing."""
+"""Utility functions for ID normalization, response parsing and JSON I/O."""
 
+import json
 import re
+from typing import Any, TypedDict
 
 from .errors import InvalidIdentifierError
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the ``fast`` extra
+    orjson = None  # type: ignore[assignment]
+
 # arXiv ID patterns
 # New style: YYMM.NNNNN (with optional vN version suffix)
 _ARXIV_NEW_RE = re.compile(r"^(\d{4}\.\d{4,5})(v\d+)?$")
 # Old style: archive/YYMMNNN (with optional vN version suffix)
 _ARXIV_OLD_RE = re.compile(r"^([a-z-]+/\d{7})(v\d+)?$")
-# Full arXiv URL
-_ARXIV_URL_RE = re.compile(r"arxiv\.org/abs/(.+?)(?:v\d+)?$")
+# Full arXiv URL; the ID (with any version suffix) follows this marker
+_ARXIV_URL_MARKER = "arxiv.org/abs/"
 
 # DOI pattern
 _DOI_RE = re.compile(r"^10\.\d{4,9}/[^\s]+$")
 # DOI URL
 _DOI_URL_RE = re.compile(r"doi\.org/(10\.\d{4,9}/[^\s]+)$")
 
-# Inspire ID: purely numeric
-_INSPIRE_ID_RE = re.compile(r"^\d+$")
+# Bare arXiv and DOI forms in one alternation, so detect_identifier_type
+# classifies with a single fullmatch and dispatches on ``lastgroup``
+# (the version suffixes are non-capturing so they never become lastgroup).
+# Inspire IDs are purely numeric and checked with str methods instead.
+_ID_RE = re.compile(
+    r"(?P<arxiv_new>\d{4}\.\d{4,5})(?:v\d+)?"
+    r"|(?P<arxiv_old>[a-z-]+/\d{7})(?:v\d+)?"
+    r"|(?P<doi>10\.\d{4,9}/\S+)"
+)
 
+# Public record page; the numeric Inspire ID is appended
+INSPIRE_LITERATURE_URL = "https://inspirehep.net/literature/"
 
-def normalize_arxiv_id(raw: str) -> str:
-    """Normalize an arXiv identifier to its canonical form (without version).
 
-    Accepts: '2301.12345', '2301.12345v2', 'hep-ph/0123456',
-             'https://arxiv.org/abs/2301.12345'
+def json_dumps(obj: Any, *, pretty: bool = False) -> str:
+    """Serialise ``obj`` to a JSON string, compact unless ``pretty`` is set.
 
-    Returns the bare ID, e.g. '2301.12345' or 'hep-ph/0123456'.
-    Raises InvalidIdentifierError if the format is unrecognised.
+    Uses orjson when installed and the stdlib encoder otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None).decode()
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def json_dumpb(obj: Any) -> bytes:
+    """Serialise ``obj`` to compact UTF-8 JSON bytes.
+
+    With orjson this is the encoder's own output, with no ``str`` copy.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse a JSON document, using orjson when installed.
+
+    Raises ``json.JSONDecodeError`` (orjson's error subclasses it) on bad input.
     """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _try_normalize_arxiv(raw: str) -> str | None:
+    """Return the bare arXiv ID for ``raw``, or None if it is not one."""
+    raw = raw.strip()
+
+    # Try URL first; the patterns below strip the version suffix
+    _, marker, rest = raw.partition(_ARXIV_URL_MARKER)
+    if marker and rest:
+        raw = rest
+
+    # Strip version suffix for matching. Only one shape can apply: new-style
+    # IDs have their dot at index 4 and old-style ones always contain a slash
+    if raw[4:5] == ".":
+        m = _ARXIV_NEW_RE.match(raw)
+    elif "/" in raw:
+        m = _ARXIV_OLD_RE.match(raw)
+    else:
+        return None
+    return m.group(1) if m else None
+
+
+def _try_normalize_doi(raw: str) -> str | None:
+    """Return the bare DOI for ``raw``, or None if it is not one."""
     raw = raw.strip()
 
     # Try URL first
-    url_match = _ARXIV_URL_RE.search(raw)
+    url_match = _DOI_URL_RE.search(raw)
     if url_match:
         raw = url_match.group(1)
 
-    # Strip version suffix for matching
-    if _ARXIV_NEW_RE.match(raw):
-        return _ARXIV_NEW_RE.match(raw).group(1)  # type: ignore[union-attr]
-    if _ARXIV_OLD_RE.match(raw):
-        return _ARXIV_OLD_RE.match(raw).group(1)  # type: ignore[union-attr]
+    return raw if _DOI_RE.match(raw) else None
+
+
+def normalize_arxiv_id(raw: str) -> str:
+    """Normalize an arXiv identifier to its canonical form (without version).
+
+    Accepts: '2301.12345', '2301.12345v2', 'hep-ph/0123456',
+             'https://arxiv.org/abs/2301.12345'
 
-    raise InvalidIdentifierError("arXiv", raw)
+    Returns the bare ID, e.g. '2301.12345' or 'hep-ph/0123456'.
+    Raises InvalidIdentifierError if the format is unrecognised.
+    """
+    arxiv_id = _try_normalize_arxiv(raw)
+    if arxiv_id is None:
+        raise InvalidIdentifierError("arXiv", raw.strip())
+    return arxiv_id
 
 
 def normalize_doi(raw: str) -> str:
@@ -55,17 +126,10 @@ def normalize_doi(raw: str) -> str:
     Returns the bare DOI string.
     Raises InvalidIdentifierError if the format is unrecognised.
     """
-    raw = raw.strip()
-
-    # Try URL first
-    url_match = _DOI_URL_RE.search(raw)
-    if url_match:
-        raw = url_match.group(1)
-
-    if _DOI_RE.match(raw):
-        return raw
-
-    raise InvalidIdentifierError("DOI", raw)
+    doi = _try_normalize_doi(raw)
+    if doi is None:
+        raise InvalidIdentifierError("DOI", raw.strip())
+    return doi
 
 
 def normalize_inspire_id(raw: str) -> str:
@@ -74,7 +138,7 @@ def normalize_inspire_id(raw: str) -> str:
     Raises InvalidIdentifierError if not numeric.
     """
     raw = raw.strip()
-    if _INSPIRE_ID_RE.match(raw):
+    if raw.isascii() and raw.isdigit():
         return raw
     raise InvalidIdentifierError("Inspire", raw)
 
@@ -87,30 +151,73 @@ def detect_identifier_type(raw: str) -> tuple[str, str]:
     """
     raw = raw.strip()
 
-    # DOI always starts with 10. or contains doi.org
+    # Pure numeric → Inspire ID
+    if raw.isascii() and raw.isdigit():
+        return ("inspire", raw)
+
+    # Bare identifiers: one pass classifies and extracts
+    m = _ID_RE.fullmatch(raw)
+    if m:
+        if m.lastgroup == "doi":
+            return ("doi", raw)
+        # arXiv, without its version suffix
+        return ("arxiv", m["arxiv_new"] or m["arxiv_old"])
+
+    # URLs, and DOI-looking input the bare pattern rejected; a failure keeps
+    # the format hint of the type it looked like
     if raw.startswith("10.") or "doi.org/" in raw:
-        return ("doi", normalize_doi(raw))
+        if (doi := _try_normalize_doi(raw)) is not None:
+            return ("doi", doi)
+        id_type = "DOI"
+    elif "arxiv.org" in raw:
+        if (arxiv_id := _try_normalize_arxiv(raw)) is not None:
+            return ("arxiv", arxiv_id)
+        id_type = "arXiv"
+    else:
+        id_type = "unknown"
 
-    # arXiv URL
-    if "arxiv.org" in raw:
-        return ("arxiv", normalize_arxiv_id(raw))
+    raise InvalidIdentifierError(id_type, raw)
 
-    # Old-style arXiv (contains /)
-    if "/" in raw and _ARXIV_OLD_RE.match(raw.split("v")[0] if "v" in raw else raw):
-        return ("arxiv", normalize_arxiv_id(raw))
 
-    # New-style arXiv (YYMM.NNNNN)
-    if "." in raw and _ARXIV_NEW_RE.match(raw.split("v")[0] if "v" in raw else raw):
-        return ("arxiv", normalize_arxiv_id(raw))
+class PaperAuthor(TypedDict):
+    """An author entry in :class:`PaperMetadata`."""
+
+    full_name: str
+    affiliations: list[str]
 
-    # Pure numeric → Inspire ID
-    if _INSPIRE_ID_RE.match(raw):
-        return ("inspire", raw)
 
-    raise InvalidIdentifierError("unknown", raw)
+class Publication(TypedDict):
+    """Journal reference of a paper (first ``publication_info`` entry)."""
 
+    journal_title: str
+    journal_volume: str
+    page_start: str
+    year: int | None
 
-def parse_paper_metadata(record: dict) -> dict:
+
+class PaperMetadata(TypedDict):
+    """Standardised paper summary returned by :func:`parse_paper_metadata`.
+
+    A plain dict at runtime, so it serialises directly and tools can copy
+    and extend it.
+    """
+
+    inspire_id: str
+    title: str
+    authors: list[PaperAuthor]
+    total_authors: int
+    abstract: str
+    arxiv_id: str | None
+    arxiv_categories: list[str]
+    doi: str | None
+    publication: Publication | None
+    collaborations: list[str]
+    citation_count: int
+    date: str
+    inspire_url: str
+
+
+def parse_paper_metadata(record: dict) -> PaperMetadata:
     """Extract a standardised paper metadata dict from an InspireHEP API record.
 
     The input `record` is a single element from the API's `hits.hits` array,
@@ -120,29 +227,32 @@ def parse_paper_metadata(record: dict) -> dict:
 
     # Authors – keep first 10 + total count
     raw_authors = meta.get("authors", [])
-    authors = [
-        {
-            "full_name": a.get("full_name", ""),
-            "affiliations": [
-                aff.get("value", "") for aff in a.get("affiliations", [])
-            ],
-        }
-        for a in raw_authors[:10]
-    ]
+    total_authors = len(raw_authors)
+    authors: list[PaperAuthor] = []
+    for a in raw_authors[:10]:
+        affs = a.get("affiliations")
+        authors.append(
+            {
+                "full_name": a.get("full_name", ""),
+                "affiliations": [aff.get("value", "") for aff in affs] if affs else [],
+            }
+        )
 
     # arXiv eprint
-    arxiv_eprints = meta.get("arxiv_eprints", [])
-    arxiv_id = arxiv_eprints[0].get("value", "") if arxiv_eprints else None
-    arxiv_categories = arxiv_eprints[0].get("categories", []) if arxiv_eprints else []
+    if arxiv_eprints := meta.get("arxiv_eprints"):
+        eprint = arxiv_eprints[0]
+        arxiv_id = eprint.get("value", "")
+        arxiv_categories = eprint.get("categories", [])
+    else:
+        arxiv_id = None
+        arxiv_categories = []
 
     # DOIs
-    dois = meta.get("dois", [])
-    doi = dois[0].get("value", "") if dois else None
+    doi = dois[0].get("value", "") if (dois := meta.get("dois")) else None
 
     # Publication info
-    pub_info = meta.get("publication_info", [])
-    publication = None
-    if pub_info:
+    publication: Publication | None = None
+    if pub_info := meta.get("publication_info"):
         p = pub_info[0]
         publication = {
             "journal_title": p.get("journal_title", ""),
@@ -158,17 +268,21 @@ def parse_paper_metadata(record: dict) -> dict:
     citation_count = meta.get("citation_count", 0)
 
     # Abstracts
-    abstracts = meta.get("abstracts", [])
-    abstract = abstracts[0].get("value", "") if abstracts else ""
+    abstract = abstracts[0].get("value", "") if (abstracts := meta.get("abstracts")) else ""
+
+    # Title
+    title = titles[0].get("title", "") if (titles := meta.get("titles")) else ""
+
+    # Earliest date; the legacy field is only consulted when it is missing
+    earliest_date = meta.get("earliest_date") or meta.get("legacy_creation_date") or ""
 
-    # Earliest date
-    earliest_date = meta.get("earliest_date", meta.get("legacy_creation_date", ""))
+    inspire_id = str(record.get("id", ""))
 
     return {
-        "inspire_id": str(record.get("id", "")),
-        "title": meta.get("titles", [{}])[0].get("title", "") if meta.get("titles") else "",
+        "inspire_id": inspire_id,
+        "title": title,
         "authors": authors,
-        "total_authors": len(raw_authors),
+        "total_authors": total_authors,
         "abstract": abstract,
         "arxiv_id": arxiv_id,
         "arxiv_categories": arxiv_categories,
@@ -177,5 +291,5 @@ def parse_paper_metadata(record: dict) -> dict:
         "collaborations": collaborations,
         "citation_count": citation_count,
         "date": earliest_date,
-        "inspire_url": f"https://inspirehep.net/literature/{record.get('id', '')}",
+        "inspire_url": INSPIRE_LITERATURE_URL + inspire_id,
     }
@@ -1,12 +1,21 @@
 """Unit tests for TTLCache and SQLiteCache."""
 
+import asyncio
 import os
+import sqlite3
 import tempfile
+import threading
 import time
 
 import pytest
 
-from inspirehep_mcp.cache import TTLCache, SQLiteCache, create_cache
+from inspirehep_mcp.cache import (
+    _STORAGE_FORMAT,
+    TTLCache,
+    SQLiteCache,
+    TieredCache,
+    create_cache,
+)
 
 
 # ======================================================================
@@ -31,6 +40,13 @@ class TestTTLCache:
         time.sleep(0.06)
         assert cache.get("k1") is None
 
+    def test_explicit_deadline(self):
+        cache = TTLCache(ttl_seconds=60)
+        cache.set("k1", "value", deadline=time.monotonic_ns() + 50_000_000)
+        assert cache.get("k1") == "value"
+        time.sleep(0.06)
+        assert cache.get("k1") is None
+
     def test_lru_eviction(self):
         cache = TTLCache(max_size=2)
         cache.set("a", 1)
@@ -98,6 +114,11 @@ class TestTTLCache:
         cache.set("b", 2)  # evicts "a"
         assert cache.stats["evictions"] == 1
 
+    async def test_aset(self):
+        cache = TTLCache()
+        await cache.aset("k1", {"data": 1})
+        assert cache.get("k1") == {"data": 1}
+
 
 # ======================================================================
 # SQLiteCache
@@ -123,6 +144,11 @@ class TestSQLiteCache:
         cache.set("k1", "plain string")
         assert cache.get("k1") == "plain string"
 
+    def test_numeric_looking_string_stays_string(self, db_path):
+        cache = SQLiteCache(db_path=db_path)
+        cache.set("k1", "123")
+        assert cache.get("k1") == "123"
+
     def test_expiration(self, db_path):
         cache = SQLiteCache(db_path=db_path, ttl_seconds=0.05)
         cache.set("k1", "value")
@@ -141,6 +167,16 @@ class TestSQLiteCache:
         assert cache.get("b") == 2
         assert cache.get("c") == 3
 
+    def test_eviction_deferred_within_slack(self, db_path):
+        cache = SQLiteCache(db_path=db_path, max_size=10)
+        cache.set_many((f"k{i}", i) for i in range(11))
+        assert cache.size == 11  # within 10% slack, no eviction yet
+        cache.set("k11", 11)
+        assert cache.size == 10
+        assert cache.stats["evictions"] == 2
+        assert cache.get("k0") is None
+        assert cache.get("k11") == 11
+
     def test_overwrite_existing_key(self, db_path):
         cache = SQLiteCache(db_path=db_path)
         cache.set("k1", "old")
@@ -179,6 +215,111 @@ class TestSQLiteCache:
         assert stats["hits"] == 1
         assert stats["misses"] == 1
 
+    def test_pragmas_applied(self, db_path):
+        cache = SQLiteCache(db_path=db_path)
+        db = cache._db
+        assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert db.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert db.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert db.execute("PRAGMA busy_timeout").fetchone()[0] == 3000
+
+    def test_set_many(self, db_path):
+        cache = SQLiteCache(db_path=db_path)
+        cache.set_many([("a", 1), ("b", {"x": 2}), ("c", "three")])
+        assert cache.get("a") == 1
+        assert cache.get("b") == {"x": 2}
+        assert cache.get("c") == "three"
+        assert cache.size == 3
+
+    def test_transaction_defers_writes(self, db_path):
+        cache = SQLiteCache(db_path=db_path)
+        with cache.transaction():
+            cache.set("k1", "v1")
+            cache.set("k2", "v2")
+            assert cache.size == 0  # not yet flushed
+        assert cache.get("k1") == "v1"
+        assert cache.get("k2") == "v2"
+
+    def test_transaction_is_per_thread(self, db_path):
+        cache = SQLiteCache(db_path=db_path)
+        with cache.transaction():
+            cache.set("k1", "v1")
+            other = threading.Thread(target=cache.set, args=("k2", "v2"))
+            other.start()
+            other.join()
+            # The other thread's write commits at once; ours stays buffered
+            assert cache.get("k2") == "v2"
+            assert cache.get("k1") is None
+        assert cache.get("k1") == "v1"
+
+    def test_size_does_not_wait_for_write_lock(self, db_path):
+        cache = SQLiteCache(db_path=db_path)
+        cache.set("k1", "v1")
+        sizes: list[int] = []
+        with cache._write_lock:
+            reader = threading.Thread(target=lambda: sizes.append(cache.size))
+            reader.start()
+            reader.join(timeout=1)
+            assert sizes == [1]
+
+    def test_set_many_enforces_max_size(self, db_path):
+        cache = SQLiteCache(db_path=db_path, max_size=2)
+        cache.set_many([("a", 1), ("b", 2), ("c", 3)])
+        assert cache.size == 2
+        assert cache.stats["evictions"] == 1
+
+    async def test_aset(self, db_path):
+        cache = SQLiteCache(db_path=db_path)
+        await cache.aset("k1", {"data": 1})
+        assert cache.get("k1") == {"data": 1}
+
+    async def test_concurrent_aset(self, db_path):
+        cache = SQLiteCache(db_path=db_path)
+        await asyncio.gather(*(cache.aset(f"k{i}", i) for i in range(20)))
+        assert cache.size == 20
+        assert all(cache.get(f"k{i}") == i for i in range(20))
+
+    def test_in_memory_db(self):
+        cache = SQLiteCache(db_path=":memory:")
+        cache.set("k1", "v1")
+        assert cache.get("k1") == "v1"
+
+    @staticmethod
+    def _write_raw_row(db_path, value, user_version=None):
+        """Insert a row behind the cache's back, optionally re-marking the file."""
+        db = sqlite3.connect(db_path)
+        db.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, ts INTEGER NOT NULL)")
+        db.execute("INSERT OR REPLACE INTO cache VALUES ('k1', ?, ?)", (value, time.time_ns()))
+        if user_version is not None:
+            db.execute(f"PRAGMA user_version = {user_version}")
+        db.commit()
+        db.close()
+
+    def test_records_storage_format(self, db_path):
+        SQLiteCache(db_path=db_path)
+        db = sqlite3.connect(db_path)
+        assert db.execute("PRAGMA user_version").fetchone()[0] == _STORAGE_FORMAT
+        db.close()
+
+    @pytest.mark.parametrize("user_version", [0, 3 - _STORAGE_FORMAT])
+    def test_other_storage_format_is_rebuilt(self, db_path, user_version):
+        # A row as the other encoding would have left it (JSONB for "plain")
+        self._write_raw_row(db_path, b"Wplain", user_version=user_version)
+        cache = SQLiteCache(db_path=db_path)
+        assert cache.get("k1") is None
+        assert cache.size == 0
+        cache.set("k1", "plain")
+        assert cache.get("k1") == "plain"
+
+    @pytest.mark.parametrize("value", [b"\x00\xff", "not json"])
+    def test_undecodable_row_is_miss(self, db_path, value):
+        SQLiteCache(db_path=db_path)
+        self._write_raw_row(db_path, value)
+        cache = SQLiteCache(db_path=db_path)
+        assert cache.get("k1") is None
+        assert cache.stats["hits"] == 0
+        assert cache.stats["misses"] == 1
+
     def test_graceful_fallback_bad_path(self):
         cache = SQLiteCache(db_path="/nonexistent/dir/cache.db")
         cache.set("k1", "v1")  # should not raise
@@ -186,6 +327,84 @@ class TestSQLiteCache:
         assert cache.size == 0
 
 
+# ======================================================================
+# TieredCache
+# ======================================================================
+
+
+class TestTieredCache:
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        return str(tmp_path / "tiered_cache.db")
+
+    def test_set_and_get(self, db_path):
+        cache = TieredCache(db_path=db_path)
+        cache.set("k1", {"data": 1})
+        assert cache.get("k1") == {"data": 1}
+
+    def test_hot_key_served_from_l1(self, db_path):
+        cache = TieredCache(db_path=db_path)
+        cache.set("k1", "v1")
+        cache.get("k1")
+        cache.get("k1")
+        assert cache.stats["l1"]["hits"] == 2
+        assert cache.stats["l2"]["hits"] == 0
+
+    def test_l2_hit_promotes_to_l1(self, db_path):
+        SQLiteCache(db_path=db_path).set("k1", "persisted")
+        cache = TieredCache(db_path=db_path)
+        assert cache.get("k1") == "persisted"  # from SQLite
+        assert cache.get("k1") == "persisted"  # from memory
+        stats = cache.stats
+        assert stats["l2"]["hits"] == 1
+        assert stats["l1"]["hits"] == 1
+        assert stats["hits"] == 2
+        assert stats["hit_rate_percent"] == 100.0
+
+    def test_promoted_entry_expires_with_l2_row(self, db_path):
+        SQLiteCache(db_path=db_path, ttl_seconds=0.3).set("k1", "persisted")
+        cache = TieredCache(db_path=db_path, ttl_seconds=0.3)
+        time.sleep(0.2)
+        assert cache.get("k1") == "persisted"  # promoted with ~0.1 s left
+        time.sleep(0.15)
+        assert cache._l2.get("k1") is None
+        assert cache.get("k1") is None
+
+    def test_l1_eviction_falls_back_to_l2(self, db_path):
+        cache = TieredCache(db_path=db_path, l1_size=1)
+        cache.set("a", 1)
+        cache.set("b", 2)  # pushes "a" out of L1
+        assert cache.get("a") == 1
+        assert cache.stats["l2"]["hits"] == 1
+
+    def test_miss(self, db_path):
+        cache = TieredCache(db_path=db_path)
+        assert cache.get("missing") is None
+        assert cache.stats["misses"] == 1
+
+    def test_invalidate(self, db_path):
+        cache = TieredCache(db_path=db_path)
+        cache.set("k1", "value")
+        cache.invalidate("k1")
+        assert cache.get("k1") is None
+
+    def test_clear(self, db_path):
+        cache = TieredCache(db_path=db_path)
+        cache.set("a", 1)
+        cache.clear()
+        assert cache.size == 0
+        assert cache.get("a") is None
+
+    async def test_aset(self, db_path):
+        cache = TieredCache(db_path=db_path)
+        await cache.aset("k1", "v1")
+        assert cache.get("k1") == "v1"
+        assert SQLiteCache(db_path=db_path).get("k1") == "v1"
+
+    def test_stats_backend(self, db_path):
+        assert TieredCache(db_path=db_path).stats["backend"] == "tiered"
+
+
 # ======================================================================
 # create_cache factory
 # ======================================================================
@@ -196,10 +415,10 @@ class TestCreateCache:
         cache = create_cache()
         assert isinstance(cache, TTLCache)
 
-    def test_persistent_sqlite(self, tmp_path):
+    def test_persistent_tiered(self, tmp_path):
         db_path = str(tmp_path / "factory_test.db")
         cache = create_cache(persistent=True, db_path=db_path)
-        assert isinstance(cache, SQLiteCache)
+        assert isinstance(cache, TieredCache)
 
     def test_custom_params(self):
         cache = create_cache(ttl_seconds=100, max_size=10)
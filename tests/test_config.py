@@ -1,5 +1,6 @@
 """Unit tests for configuration module."""
 
+import dataclasses
 import os
 
 import pytest
@@ -55,3 +56,15 @@ class TestSettings:
         assert s.cache_persistent is False
         assert s.cache_db_path == "inspirehep_cache.db"
         assert s.log_level == "INFO"
+
+    def test_reads_env_at_construction(self, monkeypatch):
+        monkeypatch.setenv("INSPIREHEP_CACHE_MAX_SIZE", "64")
+        monkeypatch.setenv("INSPIREHEP_CACHE_PERSISTENT", "true")
+        s = Settings()
+        assert s.cache_max_size == 64
+        assert s.cache_persistent is True
+
+    def test_frozen(self):
+        s = Settings()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            s.api_timeout = 5.0  # type: ignore[misc]
@@ -0,0 +1,230 @@
+"""Offline unit tests for tool helpers (no network access)."""
+
+import asyncio
+
+import pytest
+
+from inspirehep_mcp import tools
+from inspirehep_mcp.errors import InspireHEPError
+from inspirehep_mcp.tools import (
+    _build_detail_response,
+    _citation_metrics,
+    _first_successful,
+    _parse_record,
+    _resolve_author_bai,
+    tool_cache_stats,
+)
+
+
+def _papers(*counts: int) -> list[dict]:
+    return [{"citation_count": c} for c in counts]
+
+
+# ======================================================================
+# _citation_metrics
+# ======================================================================
+
+
+class TestCitationMetrics:
+    def test_empty(self):
+        assert _citation_metrics([]) == (0, 0)
+
+    def test_all_zeros(self):
+        assert _citation_metrics(_papers(0, 0, 0)) == (0, 0)
+
+    def test_known_h_index(self):
+        # Three papers with >= 3 citations, not four with >= 4
+        assert _citation_metrics(_papers(10, 8, 5, 3, 0)) == (26, 3)
+
+    def test_counts_above_n(self):
+        # h can never exceed the number of papers
+        assert _citation_metrics(_papers(1000, 500, 200)) == (1700, 3)
+
+    def test_single_cited_paper(self):
+        assert _citation_metrics(_papers(7)) == (7, 1)
+
+    def test_missing_count_is_zero(self):
+        assert _citation_metrics([{}, {"citation_count": 2}]) == (2, 1)
+
+    def test_matches_sort_based_definition(self):
+        counts = [(i * 37) % 23 for i in range(60)]
+        ranked = sorted(counts, reverse=True)
+        expected_h = sum(1 for i, c in enumerate(ranked) if c >= i + 1)
+        assert _citation_metrics(_papers(*counts)) == (sum(counts), expected_h)
+
+
+# ======================================================================
+# _parse_record
+# ======================================================================
+
+
+def _record(title: str = "T", updated: str = "2024-01-01", citations: int = 1) -> dict:
+    return {
+        "id": 42,
+        "updated": updated,
+        "metadata": {
+            "titles": [{"title": title}],
+            "authors": [{"full_name": "A", "ids": [{"schema": "INSPIRE BAI", "value": "A.1"}]}],
+            "citation_count": citations,
+        },
+    }
+
+
+class TestParseRecord:
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        tools._PARSED_CACHE.clear()
+        yield
+        tools._PARSED_CACHE.clear()
+
+    def test_hit_returns_cached_summary(self):
+        first = _parse_record(_record())
+        assert _parse_record(_record()) is first
+        assert tools._PARSED_CACHE.stats["hits"] >= 1
+
+    def test_changed_updated_is_reparsed(self):
+        _parse_record(_record(title="Old"))
+        assert _parse_record(_record(title="New", updated="2024-02-01"))["title"] == "New"
+
+    def test_changed_citation_count_is_reparsed(self):
+        _parse_record(_record(citations=1))
+        assert _parse_record(_record(citations=5))["citation_count"] == 5
+
+    def test_record_without_id_bypasses_cache(self):
+        record = {"metadata": {"titles": [{"title": "T"}]}}
+        assert _parse_record(record) is not _parse_record(record)
+        assert tools._PARSED_CACHE.size == 0
+
+    def test_detail_response_leaves_shared_entry_untouched(self):
+        shared = _parse_record(_record())
+        snapshot = dict(shared)
+        detail = _build_detail_response(_record())
+        assert "urls" in detail
+        assert detail["authors"][0]["inspire_ids"] == ["A.1"]
+        assert _parse_record(_record()) is shared
+        assert shared == snapshot
+
+
+# ======================================================================
+# _resolve_author_bai
+# ======================================================================
+
+
+class _FakeAuthorsClient:
+    """Stands in for InspireHEPClient, counting search_authors calls."""
+
+    def __init__(self, hits=None, error=None):
+        self._hits = hits or []
+        self._error = error
+        self.calls = 0
+
+    async def search_authors(self, query, size=1):
+        self.calls += 1
+        if self._error is not None:
+            raise self._error
+        return {"hits": {"hits": self._hits}}
+
+
+_WITTEN_HIT = {
+    "id": 7,
+    "metadata": {
+        "name": {"value": "Witten, Edward"},
+        "ids": [
+            {"schema": "ORCID", "value": "0000-0000-0000-0000"},
+            {"schema": "INSPIRE BAI", "value": "E.Witten.1"},
+        ],
+    },
+}
+
+
+class TestResolveAuthorBai:
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        tools._BAI_CACHE.clear()
+        yield
+        tools._BAI_CACHE.clear()
+
+    async def test_resolves_bai(self):
+        client = _FakeAuthorsClient([_WITTEN_HIT])
+        bai, info = await _resolve_author_bai(client, "Witten, Edward")
+        assert bai == "E.Witten.1"
+        assert info["inspire_author_id"] == "7"
+
+    async def test_hit_skips_api_call(self):
+        client = _FakeAuthorsClient([_WITTEN_HIT])
+        first = await _resolve_author_bai(client, "Witten, Edward")
+        assert await _resolve_author_bai(client, "Witten, Edward") == first
+        assert client.calls == 1
+
+    async def test_casefolded_and_padded_names_share_entry(self):
+        client = _FakeAuthorsClient([_WITTEN_HIT])
+        await _resolve_author_bai(client, "Witten, Edward")
+        bai, _ = await _resolve_author_bai(client, "  WITTEN, edward ")
+        assert bai == "E.Witten.1"
+        assert client.calls == 1
+
+    async def test_cached_info_is_copied(self):
+        client = _FakeAuthorsClient([_WITTEN_HIT])
+        _, info = await _resolve_author_bai(client, "Witten, Edward")
+        info["bai"] = "mutated"
+        _, again = await _resolve_author_bai(client, "Witten, Edward")
+        assert again["bai"] == "E.Witten.1"
+
+    async def test_no_match_fallback_not_cached(self):
+        client = _FakeAuthorsClient([])
+        bai, info = await _resolve_author_bai(client, "Nobody, A.")
+        assert bai == "Nobody, A."
+        assert info["bai"] is None
+        await _resolve_author_bai(client, "Nobody, A.")
+        assert client.calls == 2
+
+    async def test_api_error_fallback_not_cached(self):
+        client = _FakeAuthorsClient(error=InspireHEPError("boom"))
+        assert (await _resolve_author_bai(client, "Witten, Edward"))[0] == "Witten, Edward"
+        await _resolve_author_bai(client, "Witten, Edward")
+        assert client.calls == 2
+
+    def test_reported_in_tool_cache_stats(self):
+        stats = tool_cache_stats()
+        assert stats["author_bai"]["backend"] == "memory"
+        assert "parsed_records" in stats
+
+
+# ======================================================================
+# _first_successful
+# ======================================================================
+
+
+async def _after(delay: float, result=None, error: Exception | None = None):
+    await asyncio.sleep(delay)
+    if error is not None:
+        raise error
+    return result
+
+
+class TestFirstSuccessful:
+    async def test_priority_wins_among_simultaneous_results(self):
+        # Created (and so finishing) in reverse priority order, same wait
+        low = asyncio.create_task(_after(0, {"from": "doi"}))
+        high = asyncio.create_task(_after(0, {"from": "inspire"}))
+        await asyncio.sleep(0.01)
+        assert low.done() and high.done()
+        assert await _first_successful([high, low]) == {"from": "inspire"}
+
+    async def test_first_to_succeed_wins_and_loser_is_cancelled(self):
+        slow = asyncio.create_task(_after(10, {"from": "inspire"}))
+        fast = asyncio.create_task(_after(0, {"from": "doi"}))
+        assert await _first_successful([slow, fast]) == {"from": "doi"}
+        await asyncio.sleep(0)
+        assert slow.cancelled()
+
+    async def test_failure_falls_back_to_other_task(self):
+        failing = asyncio.create_task(_after(0, error=ValueError("not found")))
+        ok = asyncio.create_task(_after(0.01, {"from": "arxiv"}))
+        assert await _first_successful([failing, ok]) == {"from": "arxiv"}
+
+    async def test_all_failing_raises_first_tasks_error(self):
+        first = asyncio.create_task(_after(0.01, error=KeyError("inspire")))
+        second = asyncio.create_task(_after(0, error=ValueError("doi")))
+        with pytest.raises(KeyError):
+            await _first_successful([first, second])
@@ -103,6 +103,12 @@ class TestGetPaperDetails:
         result = json.loads(await get_paper_details(client, arxiv_id="not-valid"))
         assert "error" in result
 
+    async def test_multiple_ids_falls_back_to_match(self, client):
+        result = json.loads(
+            await get_paper_details(client, inspire_id="99999999999", arxiv_id="1207.7214")
+        )
+        assert result["arxiv_id"] == "1207.7214"
+
     async def test_detail_fields(self, client):
         result = json.loads(await get_paper_details(client, inspire_id="3456"))
         assert "references_count" in result
@@ -1,10 +1,16 @@
 """Unit tests for ID normalization and response parsing utilities."""
 
+import json
+
 import pytest
 
+from inspirehep_mcp import utils
 from inspirehep_mcp.errors import InvalidIdentifierError
 from inspirehep_mcp.utils import (
     detect_identifier_type,
+    json_dumpb,
+    json_dumps,
+    json_loads,
     normalize_arxiv_id,
     normalize_doi,
     normalize_inspire_id,
@@ -12,6 +18,44 @@ from inspirehep_mcp.utils import (
 )
 
 
+# ======================================================================
+# json_dumps / json_loads
+# ======================================================================
+
+
+class TestJsonHelpers:
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def backend(self, request, monkeypatch):
+        if request.param == "stdlib":
+            monkeypatch.setattr(utils, "orjson", None)
+        elif utils.orjson is None:
+            pytest.skip("orjson not installed")
+        return request.param
+
+    def test_round_trip(self, backend):
+        obj = {"title": "Higgs", "authors": ["A", "B"], "count": 3, "doi": None}
+        assert json_loads(json_dumps(obj)) == obj
+
+    def test_compact_by_default(self, backend):
+        assert json_dumps({"a": 1, "b": [1, 2]}) == '{"a":1,"b":[1,2]}'
+
+    def test_pretty(self, backend):
+        out = json_dumps({"a": 1}, pretty=True)
+        assert out == '{\n  "a": 1\n}'
+
+    def test_dumpb(self, backend):
+        out = json_dumpb({"name": "Møller", "n": [1, 2]})
+        assert isinstance(out, bytes)
+        assert json_loads(out) == {"name": "Møller", "n": [1, 2]}
+
+    def test_loads_bytes(self, backend):
+        assert json_loads(b'{"a": 1}') == {"a": 1}
+
+    def test_loads_invalid_raises(self, backend):
+        with pytest.raises(json.JSONDecodeError):
+            json_loads("not json")
+
+
 # ======================================================================
 # normalize_arxiv_id
 # ======================================================================
@@ -115,6 +159,10 @@ class TestNormalizeInspireId:
         with pytest.raises(InvalidIdentifierError):
             normalize_inspire_id("")
 
+    def test_non_ascii_digits_raise(self):
+        with pytest.raises(InvalidIdentifierError):
+            normalize_inspire_id("١٢٣")
+
 
 # ======================================================================
 # detect_identifier_type
@@ -139,6 +187,14 @@ class TestDetectIdentifierType:
     def test_arxiv_old(self):
         assert detect_identifier_type("hep-ph/0123456") == ("arxiv", "hep-ph/0123456")
 
+    def test_arxiv_version_stripped(self):
+        assert detect_identifier_type("2301.12345v3") == ("arxiv", "2301.12345")
+        assert detect_identifier_type("hep-ph/0123456v2") == ("arxiv", "hep-ph/0123456")
+
+    def test_arxiv_old_archive_containing_v(self):
+        # Only a trailing vN is a version; the archive name may contain 'v'
+        assert detect_identifier_type("solv-int/9901001v1") == ("arxiv", "solv-int/9901001")
+
     def test_arxiv_url(self):
         t, v = detect_identifier_type("https://arxiv.org/abs/2301.12345")
         assert t == "arxiv"
@@ -158,75 +214,128 @@ class TestDetectIdentifierType:
 # ======================================================================
 
 
-class TestParsePaperMetadata:
-    def test_minimal_record(self):
-        record = {"id": 123, "metadata": {}}
-        result = parse_paper_metadata(record)
-        assert result["inspire_id"] == "123"
-        assert result["title"] == ""
-        assert result["authors"] == []
-        assert result["total_authors"] == 0
-        assert result["abstract"] == ""
-        assert result["arxiv_id"] is None
-        assert result["doi"] is None
-        assert result["publication"] is None
-        assert result["citation_count"] == 0
-        assert result["inspire_url"] == "https://inspirehep.net/literature/123"
-
-    def test_full_record(self):
-        record = {
-            "id": 456,
-            "metadata": {
-                "titles": [{"title": "Test Paper"}],
-                "authors": [
-                    {"full_name": "Author One", "affiliations": [{"value": "MIT"}]},
-                    {"full_name": "Author Two", "affiliations": []},
-                ],
-                "abstracts": [{"value": "This is an abstract."}],
-                "arxiv_eprints": [{"value": "2301.12345", "categories": ["hep-ph"]}],
-                "dois": [{"value": "10.1103/test"}],
-                "publication_info": [
-                    {
-                        "journal_title": "Phys.Rev.D",
-                        "journal_volume": "100",
-                        "page_start": "123",
-                        "year": 2024,
-                    }
-                ],
-                "collaborations": [{"value": "ATLAS"}],
-                "citation_count": 42,
-                "earliest_date": "2024-01-15",
+# Shared inputs, built once at import; parse_paper_metadata never mutates them
+_FULL_RECORD = {
+    "id": 456,
+    "metadata": {
+        "titles": [{"title": "Test Paper"}],
+        "authors": [
+            {"full_name": "Author One", "affiliations": [{"value": "MIT"}]},
+            {"full_name": "Author Two", "affiliations": []},
+        ],
+        "abstracts": [{"value": "This is an abstract."}],
+        "arxiv_eprints": [{"value": "2301.12345", "categories": ["hep-ph"]}],
+        "dois": [{"value": "10.1103/test"}],
+        "publication_info": [
+            {
+                "journal_title": "Phys.Rev.D",
+                "journal_volume": "100",
+                "page_start": "123",
+                "year": 2024,
+            }
+        ],
+        "collaborations": [{"value": "ATLAS"}],
+        "citation_count": 42,
+        "earliest_date": "2024-01-15",
+    },
+}
+
+_AUTHORS_20 = tuple({"full_name": f"Author {i}"} for i in range(20))
+
+
+_PARSE_CASES = [
+    pytest.param(
+        {"id": 123, "metadata": {}},
+        {
+            "inspire_id": "123",
+            "title": "",
+            "authors": [],
+            "total_authors": 0,
+            "abstract": "",
+            "arxiv_id": None,
+            "arxiv_categories": [],
+            "doi": None,
+            "publication": None,
+            "collaborations": [],
+            "citation_count": 0,
+            "date": "",
+            "inspire_url": "https://inspirehep.net/literature/123",
+        },
+        id="minimal",
+    ),
+    pytest.param(
+        _FULL_RECORD,
+        {
+            "inspire_id": "456",
+            "title": "Test Paper",
+            "authors": [
+                {"full_name": "Author One", "affiliations": ["MIT"]},
+                {"full_name": "Author Two", "affiliations": []},
+            ],
+            "abstract": "This is an abstract.",
+            "arxiv_id": "2301.12345",
+            "arxiv_categories": ["hep-ph"],
+            "doi": "10.1103/test",
+            "publication": {
+                "journal_title": "Phys.Rev.D",
+                "journal_volume": "100",
+                "page_start": "123",
+                "year": 2024,
             },
-        }
-        result = parse_paper_metadata(record)
-        assert result["inspire_id"] == "456"
-        assert result["title"] == "Test Paper"
-        assert len(result["authors"]) == 2
-        assert result["authors"][0]["full_name"] == "Author One"
-        assert result["authors"][0]["affiliations"] == ["MIT"]
-        assert result["abstract"] == "This is an abstract."
-        assert result["arxiv_id"] == "2301.12345"
-        assert result["arxiv_categories"] == ["hep-ph"]
-        assert result["doi"] == "10.1103/test"
-        assert result["publication"]["journal_title"] == "Phys.Rev.D"
-        assert result["publication"]["year"] == 2024
-        assert result["collaborations"] == ["ATLAS"]
-        assert result["citation_count"] == 42
-        assert result["date"] == "2024-01-15"
-
-    def test_authors_capped_at_10(self):
-        authors = [{"full_name": f"Author {i}"} for i in range(20)]
-        record = {"id": 1, "metadata": {"authors": authors}}
-        result = parse_paper_metadata(record)
-        assert len(result["authors"]) == 10
-        assert result["total_authors"] == 20
+            "collaborations": ["ATLAS"],
+            "citation_count": 42,
+            "date": "2024-01-15",
+        },
+        id="full",
+    ),
+    pytest.param(
+        {"id": 1, "metadata": {"authors": list(_AUTHORS_20)}},
+        {
+            "authors": [{"full_name": f"Author {i}", "affiliations": []} for i in range(10)],
+            "total_authors": 20,
+        },
+        id="cap10",
+    ),
+    pytest.param({}, {"inspire_id": "", "title": ""}, id="empty"),
+    pytest.param(
+        {"id": 1, "metadata": {"legacy_creation_date": "2020-01-01"}},
+        {"date": "2020-01-01"},
+        id="legacy_date",
+    ),
+    pytest.param(
+        {"id": 1, "metadata": {"earliest_date": "", "legacy_creation_date": "2020-01-01"}},
+        {"date": "2020-01-01"},
+        id="empty_earliest_date",
+    ),
+]
+
+
+def _make_record(i: int) -> dict:
+    """A synthetic API hit whose shape varies with ``i``."""
+    metadata: dict = {"authors": list(_AUTHORS_20[: i % 21]), "citation_count": i}
+    if i % 2:
+        metadata["titles"] = [{"title": f"Paper {i}"}]
+    if i % 3:
+        metadata["arxiv_eprints"] = [{"value": f"2301.{i:05d}", "categories": ["hep-th"]}]
+    if i % 5:
+        metadata["earliest_date"] = "2023-01-01"
+    return {"id": i, "metadata": metadata}
+
+
+_BATCH = [_make_record(i) for i in range(1000)]
 
-    def test_empty_record(self):
-        result = parse_paper_metadata({})
-        assert result["inspire_id"] == ""
-        assert result["title"] == ""
 
-    def test_legacy_date_fallback(self):
-        record = {"id": 1, "metadata": {"legacy_creation_date": "2020-01-01"}}
+class TestParsePaperMetadata:
+    @pytest.mark.parametrize("record,expected", _PARSE_CASES)
+    def test_parse(self, record, expected):
         result = parse_paper_metadata(record)
-        assert result["date"] == "2020-01-01"
+        assert expected.items() <= result.items()
+
+    def test_batch_invariants(self):
+        parse = parse_paper_metadata
+        for record in _BATCH:
+            result = parse(record)
+            assert result["inspire_id"] == str(record["id"])
+            assert len(result["authors"]) <= 10
+            assert result["total_authors"] == len(record["metadata"]["authors"])
+            assert result["citation_count"] == record["id"]